@@ -0,0 +1,39 @@
+"""
+Build both QSTCS PDF reports in parallel.
+
+generate_report.py (fpdf) and generate_detailed_report.py (ReportLab) are
+independent and CPU-bound, so each runs in its own process and the total
+wall-clock time is roughly that of the slower of the two.
+"""
+
+from __future__ import annotations
+
+import argparse
+from multiprocessing import Process
+
+from generate_detailed_report import build_report
+from generate_report import create_report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the QSTCS PDF reports in parallel")
+    parser.add_argument("--summary-out", default="Quantum_Safe_Tactical_Comms_Report.pdf",
+                        help="output path for the fpdf summary report")
+    parser.add_argument("--detailed-out", default="Quantum_Safe_System_Report.pdf",
+                        help="output path for the ReportLab technical report")
+    args = parser.parse_args()
+
+    workers = [
+        Process(target=create_report, args=(args.summary_out,)),
+        Process(target=build_report, args=(args.detailed_out,)),
+    ]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+
+    return 0 if all(p.exitcode == 0 for p in workers) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -59,10 +59,10 @@ def get_lan_ip() -> str:
 # AES-256-GCM CRYPTO
 # =============================================================================
 
-def encrypt(key: bytes, plaintext: str, sender: str, recipient: str) -> dict:
+def encrypt(aead: AESGCM, plaintext: str, sender: str, recipient: str) -> dict:
     """Encrypt plaintext with AES-256-GCM. 12-byte nonce, 128-bit tag."""
     nonce = os.urandom(12)
-    ct = AESGCM(key).encrypt(nonce, plaintext.encode("utf-8"), None)
+    ct = aead.encrypt(nonce, plaintext.encode("utf-8"), None)
     return {
         "type": "chat",
         "sender": sender,
@@ -73,12 +73,12 @@ def encrypt(key: bytes, plaintext: str, sender: str, recipient: str) -> dict:
     }
 
 
-def decrypt(key: bytes, packet: dict) -> Optional[str]:
+def decrypt(aead: AESGCM, packet: dict) -> Optional[str]:
     """Decrypt and verify an AES-256-GCM message."""
     try:
         nonce = bytes.fromhex(packet["nonce"])
         ct = bytes.fromhex(packet["ciphertext"])
-        return AESGCM(key).decrypt(nonce, ct, None).decode("utf-8")
+        return aead.decrypt(nonce, ct, None).decode("utf-8")
     except Exception as e:
         return None
 
@@ -147,7 +147,7 @@ def join_existing_session(kms_url: str, device_id: str, session_id: str) -> Opti
 # CHAT
 # =============================================================================
 
-async def send_loop(ws, key, device_id, peer_id, kms_url):
+async def send_loop(ws, aead, device_id, peer_id, kms_url):
     """Read stdin, encrypt, send over WebSocket."""
     loop = asyncio.get_event_loop()
 
@@ -178,7 +178,7 @@ async def send_loop(ws, key, device_id, peer_id, kms_url):
                 print("  /status  /quit  /help")
                 continue
 
-            packet = encrypt(key, text, device_id, peer_id)
+            packet = encrypt(aead, text, device_id, peer_id)
             await ws.send(json.dumps(packet))
 
         except websockets.exceptions.ConnectionClosed:
@@ -189,14 +189,14 @@ async def send_loop(ws, key, device_id, peer_id, kms_url):
             break
 
 
-async def recv_loop(ws, key, device_id):
+async def recv_loop(ws, aead, device_id):
     """Listen for incoming messages, decrypt, print."""
     try:
         async for raw in ws:
             data = json.loads(raw)
             if data.get("type") == "chat":
                 sender = data.get("sender", "?")
-                plaintext = decrypt(key, data)
+                plaintext = decrypt(aead, data)
                 if plaintext:
                     print(f"\n  [{sender}]: {plaintext}")
                     print("  > ", end="", flush=True)
@@ -222,8 +222,10 @@ async def chat(device_id, peer_id, kms_url, chat_url, key, session_id):
             print()
             print("  > ", end="", flush=True)
 
-            sender = asyncio.create_task(send_loop(ws, key, device_id, peer_id, kms_url))
-            receiver = asyncio.create_task(recv_loop(ws, key, device_id))
+            # one cipher object for the whole session, shared by both loops
+            aead = AESGCM(key)
+            sender = asyncio.create_task(send_loop(ws, aead, device_id, peer_id, kms_url))
+            receiver = asyncio.create_task(recv_loop(ws, aead, device_id))
 
             done, pending = await asyncio.wait(
                 [sender, receiver], return_when=asyncio.FIRST_COMPLETED
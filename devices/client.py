@@ -82,6 +82,7 @@ class SoldierDevice:
         self.device_id = device_id
         self._kms = kms_service
         self._current_key: Optional[bytes] = None
+        self._aead: Optional[AESGCM] = None
         self._messages_sent = 0
         self._messages_received = 0
         
@@ -107,6 +108,12 @@ class SoldierDevice:
         """Check if device has an active key."""
         return self._current_key is not None
     
+    def _get_aead(self) -> AESGCM:
+        """AES-GCM cipher for the current key, built once per key."""
+        if self._aead is None:
+            self._aead = AESGCM(self._current_key)
+        return self._aead
+    
     def request_key(self, force_attack: bool = False) -> bool:
         """
         Request a fresh encryption key from the KMS.
@@ -129,6 +136,7 @@ class SoldierDevice:
             True
         """
         print(f"[{self.device_id}] Requesting key from KMS...")
+        self._aead = None
         
         try:
             self._current_key = self._kms.get_fresh_key(
@@ -176,8 +184,8 @@ class SoldierDevice:
             print(f"[{self.device_id}] ❌ No key available. Call request_key() first.")
             return None
         
-        # Initialize AES-GCM cipher with session key
-        cipher = AESGCM(self._current_key)
+        # AES-GCM cipher for the session key
+        cipher = self._get_aead()
         
         # Generate random 96-bit nonce
         # CRITICAL: Nonce must NEVER be reused with the same key
@@ -242,8 +250,8 @@ class SoldierDevice:
             nonce = bytes.fromhex(message_packet['nonce'])
             ciphertext = bytes.fromhex(message_packet['ciphertext'])
             
-            # Initialize cipher and decrypt
-            cipher = AESGCM(self._current_key)
+            # Decrypt with the session key's cipher
+            cipher = self._get_aead()
             plaintext_bytes = cipher.decrypt(nonce, ciphertext, None)
             plaintext = plaintext_bytes.decode('utf-8')
             
@@ -268,6 +276,7 @@ class SoldierDevice:
         - Session is ending
         """
         self._current_key = None
+        self._aead = None
         print(f"[{self.device_id}] Session key cleared")
     
     def get_stats(self) -> Dict[str, Any]:
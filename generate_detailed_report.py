@@ -17,6 +17,8 @@ from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics import renderPDF
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
+import copy
+import functools
 import io
 
 # --- Custom Colors (Professional Defense Palette) ---
@@ -29,6 +31,8 @@ TEXT_LIGHT = HexColor("#757575")        # Grey
 BG_LIGHT = HexColor("#f5f5f5")          # Light Grey
 SUCCESS_GREEN = HexColor("#43a047")     # Green
 DANGER_RED = HexColor("#e53935")        # Red
+_BG_DIAGRAM = HexColor("#fafafa")       # Diagram canvas background
+_BG_QUANTUM = HexColor("#fff3e0")       # Quantum channel label fill
 
 # --- Custom Styles ---
 styles = getSampleStyleSheet()
@@ -121,8 +125,101 @@ styles.add(ParagraphStyle(
     spaceAfter=10
 ))
 
+# --- Table Styles ---
+# Shared look of the comparison tables: dark header row, light body, grid.
+_HEADER_ROW_CMDS = [
+    ('BACKGROUND', (0,0), (-1,0), PRIMARY_DARK),
+    ('TEXTCOLOR', (0,0), (-1,0), white),
+    ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+]
+
+_DEFENSE_COMMANDS = _HEADER_ROW_CMDS + [
+    ('FONTSIZE', (0,0), (-1,-1), 8),
+    ('BACKGROUND', (0,1), (-1,-1), BG_LIGHT),
+    ('GRID', (0,0), (-1,-1), 0.5, grey),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ('TOPPADDING', (0,0), (-1,-1), 4),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 4),
+]
+
+_DEFENSE_TABLE_STYLE = TableStyle(_DEFENSE_COMMANDS + [
+    ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+])
+
+_PHASES_TABLE_STYLE = TableStyle(_DEFENSE_COMMANDS + [
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+    ('LEFTPADDING', (0,0), (-1,-1), 5),
+])
+
+_WORKFLOW_STYLE = TableStyle(_HEADER_ROW_CMDS + [
+    ('ALIGN', (0,0), (0,-1), 'CENTER'),
+    ('ALIGN', (1,0), (-1,-1), 'LEFT'),
+    ('FONTSIZE', (0,0), (-1,-1), 8),
+    ('BACKGROUND', (0,1), (-1,-1), BG_LIGHT),
+    ('GRID', (0,0), (-1,-1), 0.5, grey),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ('TOPPADDING', (0,0), (-1,-1), 3),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 3),
+    ('LEFTPADDING', (1,0), (1,-1), 6),
+])
+
+_TECH_STYLE = TableStyle(_DEFENSE_COMMANDS + [
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+    ('LEFTPADDING', (0,0), (-1,-1), 6),
+])
+
+_ROADMAP_STYLE = TableStyle(_HEADER_ROW_CMDS + [
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+    ('FONTSIZE', (0,0), (-1,-1), 8),
+    ('BACKGROUND', (0,1), (0,1), SUCCESS_GREEN),
+    ('TEXTCOLOR', (0,1), (0,1), white),
+    ('BACKGROUND', (0,2), (-1,-1), BG_LIGHT),
+    ('GRID', (0,0), (-1,-1), 0.5, grey),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+    ('TOPPADDING', (0,0), (-1,-1), 4),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 4),
+    ('LEFTPADDING', (0,0), (-1,-1), 6),
+])
+
+
+def _defense_table(data, col_widths, style=_DEFENSE_TABLE_STYLE):
+    """Builds a Table with one of the prebuilt module-level styles."""
+    t = Table(data, colWidths=col_widths)
+    t.setStyle(style)
+    return t
+
+
+@functools.lru_cache(maxsize=256)
+def _parsed_para(text, style_name):
+    return Paragraph(text, styles[style_name])
+
+
+def _para(text, style_name):
+    """
+    Paragraph for (text, style_name), parsed once per process.
+
+    Paragraphs keep wrap/split state on the instance, so every call hands
+    out a shallow copy of the cached one rather than the cached object.
+    """
+    return copy.copy(_parsed_para(text, style_name))
+
+
+_SOURCE_TREE = """quantum-tactical-comms/
+|-- quantum_engine/bb84_simulator.py   # BB84 QKD protocol implementation
+|-- kms/key_management_service.py      # Key authority and lifecycle management
+|-- devices/client.py                  # Field device encryption client
+|-- gateway/network_gateway.py         # Message routing infrastructure
+|-- dashboard/dashboard_ui.py          # SOC monitoring interface (Streamlit)
+|-- main.py                            # Console demonstration entry point
+|-- tests/                             # Automated security verification tests"""
+
 # --- Custom Flowables ---
+# Flowable itself is not slotted, so instances keep a __dict__ for the
+# attributes platypus attaches (canv, hAlign, ...); the slots below only
+# give draw() descriptor access to the attributes it reads.
 class HorizontalLine(Flowable):
+    __slots__ = ('width', 'color', 'thickness', 'height')
+
     def __init__(self, width, color=PRIMARY_LIGHT, thickness=1):
         Flowable.__init__(self)
         self.width = width
@@ -136,6 +233,8 @@ class HorizontalLine(Flowable):
         self.canv.line(0, 2, self.width, 2)
 
 class BoxedText(Flowable):
+    __slots__ = ('text', 'box_width', 'bg_color', 'text_color', 'padding', 'height')
+
     def __init__(self, text, width, bg_color=BG_LIGHT, text_color=TEXT_DARK, padding=10, height=70):
         Flowable.__init__(self)
         self.text = text
@@ -161,7 +260,7 @@ def create_architecture_diagram():
     d = Drawing(450, 200)
     
     # Background
-    d.add(Rect(0, 0, 450, 200, fillColor=HexColor("#fafafa"), strokeColor=None))
+    d.add(Rect(0, 0, 450, 200, fillColor=_BG_DIAGRAM, strokeColor=None))
     
     # Title
     d.add(String(225, 185, "QSTCS High-Level Architecture", fontSize=11, fontName='Helvetica-Bold', textAnchor='middle', fillColor=PRIMARY_DARK))
@@ -211,7 +310,7 @@ def create_architecture_diagram():
 def create_bb84_protocol_diagram():
     """Creates detailed BB84 protocol flow with quantum mechanics annotations."""
     d = Drawing(450, 160)
-    d.add(Rect(0, 0, 450, 160, fillColor=HexColor("#fafafa"), strokeColor=None))
+    d.add(Rect(0, 0, 450, 160, fillColor=_BG_DIAGRAM, strokeColor=None))
     d.add(String(225, 148, "BB84 Quantum Key Distribution Protocol", fontSize=10, fontName='Helvetica-Bold', textAnchor='middle', fillColor=PRIMARY_DARK))
     
     # Phase boxes
@@ -232,7 +331,7 @@ def create_bb84_protocol_diagram():
         d.add(Line(x, 97, x+20, 97, strokeColor=grey, strokeWidth=1.5))
     
     # Channel labels
-    d.add(Rect(100, 35, 130, 22, fillColor=HexColor("#fff3e0"), strokeColor=ACCENT_GOLD, strokeWidth=1, rx=3))
+    d.add(Rect(100, 35, 130, 22, fillColor=_BG_QUANTUM, strokeColor=ACCENT_GOLD, strokeWidth=1, rx=3))
     d.add(String(165, 48, "Quantum Channel (Qubits)", fontSize=7, fontName='Helvetica-Bold', textAnchor='middle', fillColor=TEXT_DARK))
     
     d.add(Rect(220, 35, 130, 22, fillColor=BG_LIGHT, strokeColor=grey, strokeWidth=1, rx=3))
@@ -250,7 +349,7 @@ def create_bb84_protocol_diagram():
 def create_threat_model_diagram():
     """Creates threat model visualization."""
     d = Drawing(450, 120)
-    d.add(Rect(0, 0, 450, 120, fillColor=HexColor("#fafafa"), strokeColor=None))
+    d.add(Rect(0, 0, 450, 120, fillColor=_BG_DIAGRAM, strokeColor=None))
     d.add(String(225, 108, "Threat Model: Quantum Channel Eavesdropping", fontSize=10, fontName='Helvetica-Bold', textAnchor='middle', fillColor=PRIMARY_DARK))
     
     # Alice
@@ -285,7 +384,7 @@ def create_threat_model_diagram():
 def create_qber_chart():
     """Creates QBER comparison chart with security threshold."""
     d = Drawing(280, 130)
-    d.add(Rect(0, 0, 280, 130, fillColor=HexColor("#fafafa"), strokeColor=None))
+    d.add(Rect(0, 0, 280, 130, fillColor=_BG_DIAGRAM, strokeColor=None))
     
     bc = VerticalBarChart()
     bc.x = 45
@@ -327,47 +426,38 @@ def add_page_elements(canvas, doc):
     canvas.drawRightString(A4[0] - 0.75*inch, A4[1] - 0.5*inch, "UNCLASSIFIED")
     canvas.restoreState()
 
-# --- Main Report Builder ---
-def build_report():
-    filename = "Quantum_Safe_System_Report.pdf"
-    doc = SimpleDocTemplate(
-        filename,
-        pagesize=A4,
-        rightMargin=0.7*inch,
-        leftMargin=0.7*inch,
-        topMargin=0.6*inch,
-        bottomMargin=0.6*inch
-    )
-    
+
+# ============================================================
+# PAGE 1: COVER PAGE
+# ============================================================
+def _cover_page(page_width):
     story = []
-    page_width = A4[0] - 1.4*inch
-    
-    # ============================================================
-    # PAGE 1: COVER PAGE
-    # ============================================================
     story.append(Spacer(1, 1.2*inch))
-    story.append(Paragraph("QUANTUM-SAFE TACTICAL", styles['MainTitle']))
-    story.append(Paragraph("COMMUNICATION SYSTEM", styles['MainTitle']))
+    story.append(_para("QUANTUM-SAFE TACTICAL", 'MainTitle'))
+    story.append(_para("COMMUNICATION SYSTEM", 'MainTitle'))
     story.append(Spacer(1, 0.2*inch))
     story.append(HorizontalLine(page_width, color=ACCENT_GOLD, thickness=2))
     story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("Technical Architecture and Security Analysis", styles['Subtitle']))
-    story.append(Paragraph("Submitted for iDEX Defence Innovation Challenge", styles['Subtitle']))
+    story.append(_para("Technical Architecture and Security Analysis", 'Subtitle'))
+    story.append(_para("Submitted for iDEX Defence Innovation Challenge", 'Subtitle'))
     story.append(Spacer(1, 0.6*inch))
     
     story.append(create_architecture_diagram())
-    story.append(Paragraph("Figure 1: High-level system architecture showing trusted security perimeter and component relationships.", styles['Caption']))
+    story.append(_para("Figure 1: High-level system architecture showing trusted security perimeter and component relationships.", 'Caption'))
     story.append(Spacer(1, 0.3*inch))
     
-    story.append(Paragraph("A software-defined quantum key distribution prototype enabling provably secure tactical communications resistant to both classical and quantum cryptanalytic attacks.", styles['Callout']))
+    story.append(_para("A software-defined quantum key distribution prototype enabling provably secure tactical communications resistant to both classical and quantum cryptanalytic attacks.", 'Callout'))
     story.append(Spacer(1, 0.4*inch))
-    story.append(Paragraph("Document Version 2.0 | Classification: UNCLASSIFIED | January 2026", styles['Footer']))
-    story.append(PageBreak())
-    
-    # ============================================================
-    # PAGE 2: TABLE OF CONTENTS + EXECUTIVE SUMMARY
-    # ============================================================
-    story.append(Paragraph("Contents", styles['SectionHeading']))
+    story.append(_para("Document Version 2.0 | Classification: UNCLASSIFIED | January 2026", 'Footer'))
+    return story
+
+
+# ============================================================
+# PAGE 2: TABLE OF CONTENTS + EXECUTIVE SUMMARY
+# ============================================================
+def _summary_page(page_width):
+    story = []
+    story.append(_para("Contents", 'SectionHeading'))
     story.append(HorizontalLine(page_width, color=PRIMARY_LIGHT, thickness=1))
     story.append(Spacer(1, 0.15*inch))
     
@@ -382,70 +472,70 @@ def build_report():
         ("8. Conclusion and Roadmap", "6"),
     ]
     for item, page in toc_items:
-        story.append(Paragraph(f"{item} {'.' * (50 - len(item))} {page}", styles['TOCEntry']))
+        story.append(_para(f"{item} {'.' * (50 - len(item))} {page}", 'TOCEntry'))
     
     story.append(Spacer(1, 0.25*inch))
     
     # EXECUTIVE SUMMARY
-    story.append(Paragraph("1. Executive Summary", styles['SectionHeading']))
+    story.append(_para("1. Executive Summary", 'SectionHeading'))
     story.append(HorizontalLine(page_width, color=PRIMARY_LIGHT, thickness=1))
-    story.append(Paragraph(
+    story.append(_para(
         """The Quantum-Safe Tactical Communication System (QSTCS) is a prototype secure messaging 
         platform designed for military field operations. Unlike conventional encryption schemes 
         whose security relies on computational hardness assumptions vulnerable to quantum algorithms, 
         QSTCS implements the BB84 Quantum Key Distribution (QKD) protocol, which derives its 
         security guarantees from the fundamental laws of quantum mechanics.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
-    story.append(Paragraph(
+    story.append(_para(
         """The system provides three critical capabilities: (1) generation of cryptographic keys 
         with information-theoretic security, (2) real-time detection of eavesdropping attempts 
         through Quantum Bit Error Rate (QBER) monitoring, and (3) authenticated encryption of 
         tactical messages using AES-256-GCM with quantum-derived keys. This design addresses the 
         "harvest now, decrypt later" threat posed by adversaries stockpiling encrypted traffic 
         for future quantum decryption.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
-    story.append(Paragraph(
+    story.append(_para(
         "Key Innovation: Software-defined QKD simulation enabling rapid prototyping and seamless migration to hardware QKD infrastructure when deployed.",
-        styles['Callout']
+        'Callout'
     ))
     story.append(Spacer(1, 0.15*inch))
     
     # THREAT LANDSCAPE
-    story.append(Paragraph("2. Threat Landscape and Motivation", styles['SectionHeading']))
+    story.append(_para("2. Threat Landscape and Motivation", 'SectionHeading'))
     story.append(HorizontalLine(page_width, color=PRIMARY_LIGHT, thickness=1))
     
-    story.append(Paragraph("2.1 The Quantum Computing Threat", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("2.1 The Quantum Computing Threat", 'SubHeading'))
+    story.append(_para(
         """Current asymmetric cryptographic systems (RSA, ECDH, DSA) rely on the computational 
         intractability of integer factorization and discrete logarithm problems. Shor's algorithm, 
         executable on a sufficiently powerful quantum computer, solves these problems in polynomial 
         time, rendering RSA-2048 and ECDH-256 effectively broken. While fault-tolerant quantum 
         computers capable of running Shor's algorithm at scale do not yet exist, intelligence 
         agencies assess their emergence within 10-15 years.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
-    story.append(Paragraph("2.2 Harvest Now, Decrypt Later (HNDL)", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("2.2 Harvest Now, Decrypt Later (HNDL)", 'SubHeading'))
+    story.append(_para(
         """Adversaries are actively intercepting and storing encrypted communications with the 
         intent to decrypt them once quantum capabilities mature. For classified military 
         communications with long-term sensitivity (strategic plans, intelligence sources, treaty 
         negotiations), this represents an immediate operational risk. Data encrypted today using 
         RSA or ECDH should be considered compromised against a patient adversary.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
-    story.append(Paragraph("2.3 Why Quantum Key Distribution?", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("2.3 Why Quantum Key Distribution?", 'SubHeading'))
+    story.append(_para(
         """QKD protocols like BB84 provide information-theoretic security: their security does not 
         depend on computational assumptions but on physical laws. Specifically, the no-cloning 
         theorem guarantees that an eavesdropper cannot copy quantum states without detection, 
         and measurement disturbance ensures any interception attempt introduces detectable errors. 
         This makes QKD-derived keys provably secure against all computational attacks, including 
         those from future quantum computers.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
     # Comparison Table
@@ -457,40 +547,31 @@ def build_report():
         ['Key Compromise', 'Silent', 'Silent', 'Detected'],
         ['Maturity', 'Deployed', 'Standardizing', 'Prototype'],
     ]
-    threat_table = Table(threat_data, colWidths=[1.5*inch, 1.3*inch, 1.3*inch, 1.3*inch])
-    threat_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), PRIMARY_DARK),
-        ('TEXTCOLOR', (0,0), (-1,0), white),
-        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,-1), 8),
-        ('BACKGROUND', (0,1), (-1,-1), BG_LIGHT),
-        ('GRID', (0,0), (-1,-1), 0.5, grey),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('TOPPADDING', (0,0), (-1,-1), 4),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 4),
-    ]))
+    threat_table = _defense_table(threat_data, [1.5*inch, 1.3*inch, 1.3*inch, 1.3*inch])
     story.append(Spacer(1, 0.1*inch))
     story.append(threat_table)
-    story.append(Paragraph("Table 1: Comparative security properties of key establishment mechanisms.", styles['Caption']))
-    story.append(PageBreak())
-    
-    # ============================================================
-    # PAGE 3: SYSTEM ARCHITECTURE
-    # ============================================================
-    story.append(Paragraph("3. System Architecture", styles['SectionHeading']))
+    story.append(_para("Table 1: Comparative security properties of key establishment mechanisms.", 'Caption'))
+    return story
+
+
+# ============================================================
+# PAGE 3: SYSTEM ARCHITECTURE
+# ============================================================
+def _architecture_page(page_width):
+    story = []
+    story.append(_para("3. System Architecture", 'SectionHeading'))
     story.append(HorizontalLine(page_width, color=PRIMARY_LIGHT, thickness=1))
-    story.append(Paragraph(
+    story.append(_para(
         """QSTCS employs a modular architecture separating cryptographic key generation, key 
         management, and message encryption into distinct components. This design enables 
         independent security auditing and facilitates future hardware integration.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     story.append(create_architecture_diagram())
-    story.append(Paragraph("Figure 2: Component architecture with security boundary delineation.", styles['Caption']))
+    story.append(_para("Figure 2: Component architecture with security boundary delineation.", 'Caption'))
     
-    story.append(Paragraph("3.1 BB84 Quantum Engine", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("3.1 BB84 Quantum Engine", 'SubHeading'))
+    story.append(_para(
         """The core cryptographic module implementing the BB84 QKD protocol. In the current 
         prototype, quantum operations are simulated using classical randomness with 
         physics-accurate error modeling. The engine executes the complete BB84 workflow: random 
@@ -498,57 +579,60 @@ def build_report():
         sifting, and QBER calculation. The simulation accurately models eavesdropper-induced 
         disturbance, producing ~25% QBER under intercept-resend attacks as predicted by quantum 
         information theory.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
-    story.append(Paragraph("3.2 Key Management Service (KMS)", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("3.2 Key Management Service (KMS)", 'SubHeading'))
+    story.append(_para(
         """The trusted authority responsible for key lifecycle management. Upon receiving a key 
         request, the KMS invokes the BB84 engine, validates the generated key against the QBER 
         threshold (11%), and derives session keys using HKDF-SHA256. The KMS maintains session 
         state, tracks key usage, and enforces key rotation policies. All key material is held 
         only in volatile memory with no persistent storage.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
-    story.append(Paragraph("3.3 Field Device Clients", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("3.3 Field Device Clients", 'SubHeading'))
+    story.append(_para(
         """Tactical endpoints (ruggedized laptops, mobile devices) that authenticate to the KMS 
         and obtain session keys. Clients perform AES-256-GCM encryption/decryption locally, 
         ensuring plaintext never leaves the device. Each message includes a unique 96-bit nonce 
         and 128-bit authentication tag, providing both confidentiality and integrity.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
-    story.append(Paragraph("3.4 Network Gateway", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("3.4 Network Gateway", 'SubHeading'))
+    story.append(_para(
         """Message routing infrastructure connecting field devices to the KMS and to each other. 
         The gateway handles only ciphertext and cannot access plaintext. Transport security 
         (TLS 1.3) provides defense-in-depth, but primary security relies on the quantum-derived 
         symmetric keys.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
-    story.append(Paragraph("3.5 Security Operations Dashboard", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("3.5 Security Operations Dashboard", 'SubHeading'))
+    story.append(_para(
         """Read-only monitoring interface displaying real-time system health: link status 
         (secure/compromised), QBER measurements, key issuance rate, and detected attack attempts. 
         Provides situational awareness for security operations center (SOC) personnel without 
         granting key access.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
-    story.append(PageBreak())
-    
-    # ============================================================
-    # PAGE 4: BB84 PROTOCOL + SECURITY ANALYSIS
-    # ============================================================
-    story.append(Paragraph("4. BB84 Protocol Implementation", styles['SectionHeading']))
+    return story
+
+
+# ============================================================
+# PAGE 4: BB84 PROTOCOL + SECURITY ANALYSIS
+# ============================================================
+def _protocol_page(page_width):
+    story = []
+    story.append(_para("4. BB84 Protocol Implementation", 'SectionHeading'))
     story.append(HorizontalLine(page_width, color=PRIMARY_LIGHT, thickness=1))
     
     story.append(create_bb84_protocol_diagram())
-    story.append(Paragraph("Figure 3: BB84 protocol phases from preparation through verified key output.", styles['Caption']))
+    story.append(_para("Figure 3: BB84 protocol phases from preparation through verified key output.", 'Caption'))
     
-    story.append(Paragraph("4.1 Protocol Phases", styles['SubHeading']))
+    story.append(_para("4.1 Protocol Phases", 'SubHeading'))
     
     phases_data = [
         ['Phase', 'Alice (Sender)', 'Bob (Receiver)', 'Output'],
@@ -557,29 +641,16 @@ def build_report():
         ['Sifting', 'Announce B[i] over classical channel', 'Compare B\'[i], keep matches', 'Sifted key (~50%)'],
         ['Verification', 'Sample subset, compute QBER', 'QBER < 11%: Accept', '256-bit raw key'],
     ]
-    phases_table = Table(phases_data, colWidths=[0.8*inch, 1.9*inch, 1.8*inch, 1.1*inch])
-    phases_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), PRIMARY_DARK),
-        ('TEXTCOLOR', (0,0), (-1,0), white),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,-1), 8),
-        ('BACKGROUND', (0,1), (-1,-1), BG_LIGHT),
-        ('GRID', (0,0), (-1,-1), 0.5, grey),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('TOPPADDING', (0,0), (-1,-1), 4),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 4),
-        ('LEFTPADDING', (0,0), (-1,-1), 5),
-    ]))
+    phases_table = _defense_table(phases_data, [0.8*inch, 1.9*inch, 1.8*inch, 1.1*inch], _PHASES_TABLE_STYLE)
     story.append(phases_table)
-    story.append(Paragraph("Table 2: BB84 protocol execution showing Alice and Bob operations per phase.", styles['Caption']))
+    story.append(_para("Table 2: BB84 protocol execution showing Alice and Bob operations per phase.", 'Caption'))
     
     story.append(Spacer(1, 0.15*inch))
-    story.append(Paragraph("5. Security Analysis", styles['SectionHeading']))
+    story.append(_para("5. Security Analysis", 'SectionHeading'))
     story.append(HorizontalLine(page_width, color=PRIMARY_LIGHT, thickness=1))
     
-    story.append(Paragraph("5.1 Eavesdropper Detection via QBER", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("5.1 Eavesdropper Detection via QBER", 'SubHeading'))
+    story.append(_para(
         """The security of BB84 relies on the quantum mechanical principle that measurement 
         disturbs quantum states. When an eavesdropper (Eve) intercepts qubits, she must measure 
         them to extract information. If Eve chooses the wrong measurement basis (50% probability), 
@@ -587,36 +658,39 @@ def build_report():
         with the correct basis, he obtains an incorrect result with 50% probability. The combined 
         effect: Eve's interception of all qubits introduces approximately 25% error rate in the 
         sifted key.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
     story.append(create_threat_model_diagram())
-    story.append(Paragraph("Figure 4: Intercept-resend attack model showing Eve's measurement-induced disturbance.", styles['Caption']))
+    story.append(_para("Figure 4: Intercept-resend attack model showing Eve's measurement-induced disturbance.", 'Caption'))
     
-    story.append(Paragraph("5.2 Security Threshold Rationale", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("5.2 Security Threshold Rationale", 'SubHeading'))
+    story.append(_para(
         """The 11% QBER threshold is derived from information-theoretic security proofs for BB84. 
         Below this threshold, sufficient secret key can be extracted through privacy amplification 
         even if Eve obtained partial information. Above 11%, the protocol cannot guarantee secrecy 
         and must abort. Our implementation conservatively refuses key issuance at QBER > 11%, 
         alerting operators via the dashboard.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
     story.append(create_qber_chart())
-    story.append(Paragraph("Figure 5: Measured QBER comparison between secure transmission (~2%) and active eavesdropping (~25%).", styles['Caption']))
-    story.append(PageBreak())
-    
-    # ============================================================
-    # PAGE 5: OPERATIONAL WORKFLOW + TECHNICAL SPECS
-    # ============================================================
-    story.append(Paragraph("6. Operational Workflow", styles['SectionHeading']))
+    story.append(_para("Figure 5: Measured QBER comparison between secure transmission (~2%) and active eavesdropping (~25%).", 'Caption'))
+    return story
+
+
+# ============================================================
+# PAGE 5: OPERATIONAL WORKFLOW + TECHNICAL SPECS
+# ============================================================
+def _workflow_page(page_width):
+    story = []
+    story.append(_para("6. Operational Workflow", 'SectionHeading'))
     story.append(HorizontalLine(page_width, color=PRIMARY_LIGHT, thickness=1))
-    story.append(Paragraph(
+    story.append(_para(
         """The following sequence illustrates a complete secure message exchange between two 
         field units, demonstrating the integration of quantum key distribution with classical 
         authenticated encryption.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
     workflow_data = [
@@ -632,26 +706,12 @@ def build_report():
         ['9', 'Device B obtains session key from KMS', 'Symmetric key agreement'],
         ['10', 'Device B decrypts and verifies auth tag', 'Message authenticity confirmed'],
     ]
-    workflow_table = Table(workflow_data, colWidths=[0.5*inch, 3.2*inch, 1.9*inch])
-    workflow_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), PRIMARY_DARK),
-        ('TEXTCOLOR', (0,0), (-1,0), white),
-        ('ALIGN', (0,0), (0,-1), 'CENTER'),
-        ('ALIGN', (1,0), (-1,-1), 'LEFT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,-1), 8),
-        ('BACKGROUND', (0,1), (-1,-1), BG_LIGHT),
-        ('GRID', (0,0), (-1,-1), 0.5, grey),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('TOPPADDING', (0,0), (-1,-1), 3),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 3),
-        ('LEFTPADDING', (1,0), (1,-1), 6),
-    ]))
+    workflow_table = _defense_table(workflow_data, [0.5*inch, 3.2*inch, 1.9*inch], _WORKFLOW_STYLE)
     story.append(workflow_table)
-    story.append(Paragraph("Table 3: End-to-end message security workflow with cryptographic properties per step.", styles['Caption']))
+    story.append(_para("Table 3: End-to-end message security workflow with cryptographic properties per step.", 'Caption'))
     
     story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("7. Technical Specifications", styles['SectionHeading']))
+    story.append(_para("7. Technical Specifications", 'SectionHeading'))
     story.append(HorizontalLine(page_width, color=PRIMARY_LIGHT, thickness=1))
     
     tech_data = [
@@ -664,60 +724,42 @@ def build_report():
         ['Dashboard', 'Streamlit', 'Real-time SOC monitoring'],
         ['Runtime', 'Python 3.8+', 'Cross-platform deployment'],
     ]
-    tech_table = Table(tech_data, colWidths=[1.4*inch, 1.6*inch, 2.5*inch])
-    tech_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), PRIMARY_DARK),
-        ('TEXTCOLOR', (0,0), (-1,0), white),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,-1), 8),
-        ('BACKGROUND', (0,1), (-1,-1), BG_LIGHT),
-        ('GRID', (0,0), (-1,-1), 0.5, grey),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('TOPPADDING', (0,0), (-1,-1), 4),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 4),
-        ('LEFTPADDING', (0,0), (-1,-1), 6),
-    ]))
+    tech_table = _defense_table(tech_data, [1.4*inch, 1.6*inch, 2.5*inch], _TECH_STYLE)
     story.append(tech_table)
-    story.append(Paragraph("Table 4: Technical specifications and cryptographic parameters.", styles['Caption']))
+    story.append(_para("Table 4: Technical specifications and cryptographic parameters.", 'Caption'))
     
     story.append(Spacer(1, 0.15*inch))
-    story.append(Paragraph("Source Code Structure:", styles['SubHeading']))
-    code_block = """quantum-tactical-comms/
-|-- quantum_engine/bb84_simulator.py   # BB84 QKD protocol implementation
-|-- kms/key_management_service.py      # Key authority and lifecycle management
-|-- devices/client.py                  # Field device encryption client
-|-- gateway/network_gateway.py         # Message routing infrastructure
-|-- dashboard/dashboard_ui.py          # SOC monitoring interface (Streamlit)
-|-- main.py                            # Console demonstration entry point
-|-- tests/                             # Automated security verification tests"""
-    story.append(BoxedText(code_block, page_width, height=80))
-    story.append(PageBreak())
-    
-    # ============================================================
-    # PAGE 6: CONCLUSION + ROADMAP
-    # ============================================================
-    story.append(Paragraph("8. Conclusion and Development Roadmap", styles['SectionHeading']))
+    story.append(_para("Source Code Structure:", 'SubHeading'))
+    story.append(BoxedText(_SOURCE_TREE, page_width, height=80))
+    return story
+
+
+# ============================================================
+# PAGE 6: CONCLUSION + ROADMAP
+# ============================================================
+def _roadmap_page(page_width):
+    story = []
+    story.append(_para("8. Conclusion and Development Roadmap", 'SectionHeading'))
     story.append(HorizontalLine(page_width, color=PRIMARY_LIGHT, thickness=1))
     
-    story.append(Paragraph("8.1 Summary of Achievements", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("8.1 Summary of Achievements", 'SubHeading'))
+    story.append(_para(
         """QSTCS demonstrates a complete, functional prototype of quantum-safe tactical 
         communications. The system successfully implements BB84 key distribution with accurate 
         eavesdropper detection, integrates HKDF-based key derivation and AES-256-GCM encryption, 
         and provides real-time security monitoring. Automated tests verify both normal operation 
         (QBER ~0-3%) and attack detection (QBER ~25% triggering abort).""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
-    story.append(Paragraph(
+    story.append(_para(
         """The software-defined architecture enables immediate deployment for training, 
         evaluation, and operational concept development. The modular design positions the system 
         for seamless transition to hardware QKD when tactically appropriate.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
-    story.append(Paragraph("8.2 Development Roadmap", styles['SubHeading']))
+    story.append(_para("8.2 Development Roadmap", 'SubHeading'))
     
     roadmap_data = [
         ['Phase', 'Capability', 'Timeline'],
@@ -728,35 +770,20 @@ def build_report():
         ['Mid-term', 'Mobile platform clients (Android/iOS)', '12-18 months'],
         ['Long-term', 'Satellite QKD integration for global reach', '24+ months'],
     ]
-    roadmap_table = Table(roadmap_data, colWidths=[1*inch, 3.3*inch, 1.3*inch])
-    roadmap_table.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), PRIMARY_DARK),
-        ('TEXTCOLOR', (0,0), (-1,0), white),
-        ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0,0), (-1,-1), 8),
-        ('BACKGROUND', (0,1), (0,1), SUCCESS_GREEN),
-        ('TEXTCOLOR', (0,1), (0,1), white),
-        ('BACKGROUND', (0,2), (-1,-1), BG_LIGHT),
-        ('GRID', (0,0), (-1,-1), 0.5, grey),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('TOPPADDING', (0,0), (-1,-1), 4),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 4),
-        ('LEFTPADDING', (0,0), (-1,-1), 6),
-    ]))
+    roadmap_table = _defense_table(roadmap_data, [1*inch, 3.3*inch, 1.3*inch], _ROADMAP_STYLE)
     story.append(roadmap_table)
-    story.append(Paragraph("Table 5: Development roadmap from current prototype to operational deployment.", styles['Caption']))
+    story.append(_para("Table 5: Development roadmap from current prototype to operational deployment.", 'Caption'))
     
     story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("8.3 Strategic Value Proposition", styles['SubHeading']))
-    story.append(Paragraph(
+    story.append(_para("8.3 Strategic Value Proposition", 'SubHeading'))
+    story.append(_para(
         """QSTCS addresses a critical gap in defence communications: providing quantum-resistant 
         security at the tactical edge. Unlike backbone QKD networks (e.g., QNu Labs' metropolitan 
         deployments), QSTCS focuses on the "last mile" - bringing quantum-derived security directly 
         to soldiers, drones, and mobile command posts. The software-defined approach enables:""",
-        styles['CustomBody']
+        'CustomBody'
     ))
-    story.append(Paragraph(
+    story.append(_para(
         """<b>1. Rapid Deployment:</b> No specialized hardware required for initial evaluation.
         <br/><b>2. Training and Doctrine Development:</b> Enables personnel familiarization with 
         quantum security concepts before hardware deployment.
@@ -764,21 +791,56 @@ def build_report():
         application-layer changes.
         <br/><b>4. Cost Efficiency:</b> Software simulation validates operational concepts before 
         capital investment in quantum hardware.""",
-        styles['CustomBody']
+        'CustomBody'
     ))
     
     story.append(Spacer(1, 0.3*inch))
     story.append(HorizontalLine(page_width, color=ACCENT_GOLD, thickness=2))
     story.append(Spacer(1, 0.15*inch))
-    story.append(Paragraph(
+    story.append(_para(
         "This document and the accompanying prototype demonstrate readiness for Phase II development "
         "and operational pilot deployment. For technical inquiries or demonstration requests, "
         "contact the development team.",
-        styles['CustomBody']
+        'CustomBody'
     ))
     story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("--- END OF DOCUMENT ---", styles['Footer']))
-    
+    story.append(_para("--- END OF DOCUMENT ---", 'Footer'))
+    return story
+
+
+# --- Page Layout ---
+MARGIN_X = 0.7*inch
+MARGIN_Y = 0.6*inch
+
+# Each entry builds the flowables of one hand-laid-out page.
+_PAGES = (
+    _cover_page,
+    _summary_page,
+    _architecture_page,
+    _protocol_page,
+    _workflow_page,
+    _roadmap_page,
+)
+
+
+# --- Main Report Builder ---
+def build_report(filename="Quantum_Safe_System_Report.pdf"):
+    doc = SimpleDocTemplate(
+        filename,
+        pagesize=A4,
+        rightMargin=MARGIN_X,
+        leftMargin=MARGIN_X,
+        topMargin=MARGIN_Y,
+        bottomMargin=MARGIN_Y
+    )
+    page_width = A4[0] - 2*MARGIN_X
+
+    story = []
+    for i, page in enumerate(_PAGES):
+        if i:
+            story.append(PageBreak())
+        story.extend(page(page_width))
+
     # Build PDF
     doc.build(story, onFirstPage=add_page_elements, onLaterPages=add_page_elements)
     print(f"Defense-grade PDF generated: {filename}")
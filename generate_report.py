@@ -12,14 +12,8 @@ class PDF(FPDF):
         self.set_font('Arial', 'I', 8)
         self.cell(0, 10, f'Page {self.page_no()}', 0, 0, 'C')
 
-def create_report():
-    pdf = PDF()
-    pdf.add_page()
-    pdf.set_auto_page_break(auto=True, margin=15)
-    pdf.set_font("Arial", size=11)
-
-    sections = [
-        ("PART 0: What We're Actually Building (The Big Picture)", """
+_RAW_SECTIONS = (
+    ("PART 0: What We're Actually Building (The Big Picture)", """
 Imagine you're a defence unit (platoon/drone squad) in the field. You need to send secret messages (position, orders, intel) to HQ over untrusted networks (4G, radio, internet). Today's encryption can be recorded and broken later by quantum computers.
 
 Your mission: Build a communication system that:
@@ -30,7 +24,7 @@ Your mission: Build a communication system that:
 
 Think of it like: BB84 QKD (quantum) + secure messaging (classical) + attack detection (monitoring) = a complete defence communication prototype.
 """),
-        ("PART 1: Quantum Basics You Need to Know", """
+    ("PART 1: Quantum Basics You Need to Know", """
 What is BB84? (The quantum protocol we'll use)
 BB84 is a quantum key distribution protocol invented in 1984. Here's how it works:
 
@@ -60,14 +54,14 @@ Attack detection:
 
 In your system: Qiskit simulates this protocol, produces a shared key, and calculates QBER. If QBER > 11%, we know there's an eavesdropper.
 """),
-        ("PART 2: System Architecture", """
+    ("PART 2: System Architecture", """
 1. Soldier Devices (A/B): Send encrypted messages. Request fresh encryption keys from KMS.
 2. Gateway: Routes encrypted messages between field devices and HQ.
 3. KMS (Key Management Service): Central service that receives key requests, calls Qiskit simulator, and distributes keys. Monitors QBER.
 4. Qiskit BB84 Simulator: Simulates protocol, generates raw key, calculates error rate.
 5. Monitoring Dashboard: Web interface showing system status and attack alerts.
 """),
-        ("PART 3: Step-by-Step Message Journey", """
+    ("PART 3: Step-by-Step Message Journey", """
 Step 1: Soldier A requests a fresh key locally.
 Step 2: KMS runs Qiskit BB84 simulator.
    - Simulates Alice/Bob interaction.
@@ -82,7 +76,7 @@ Step 6: Soldier B decrypts message.
    - Decrypts ciphertext.
 Step 7: Dashboard updates status (Green/Red, Key Count, etc.).
 """),
-        ("PART 4: Project Code Structure", """
+    ("PART 4: Project Code Structure", """
 quantum-tactical-comms/
 |-- quantum_engine/
 |   |-- bb84_simulator.py (The Quantum Part)
@@ -96,7 +90,7 @@ quantum-tactical-comms/
 |   |-- dashboard_ui.py (The UI)
 |-- main.py (The Demo)
 """),
-        ("PART 5: For Your iDEX Proposal", """
+    ("PART 5: For Your iDEX Proposal", """
 Title: Quantum-Ready Tactical Communication System (QTCS)
 
 Problem: Defence units need unhackable communication that works against future quantum computers.
@@ -113,24 +107,34 @@ Key Innovation:
 
 Demo: Shows secure platoon comms working end-to-end with attack detection.
 """),
-        ("PART 6: Key Technologies", """
+    ("PART 6: Key Technologies", """
 - **BB84**: Quantum key distribution protocol.
 - **Qiskit**: IBM's quantum computing SDK (simulates qubits).
 - **QBER**: Quantum Bit Error Rate (attack metric).
 - **AES-GCM**: Advanced Encryption Standard (symmetric encryption).
 - **Streamlit**: Dashboard framework.
 """)
-    ]
+)
+
+# bodies are stripped once here so create_report() only lays out text
+_SECTIONS = tuple((title, body.strip()) for title, body in _RAW_SECTIONS)
+
+def create_report(filename="Quantum_Safe_Tactical_Comms_Report.pdf"):
+    pdf = PDF()
+    pdf.add_page()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.set_font("Arial", size=11)
 
-    for title, content in sections:
+    for title, content in _SECTIONS:
         pdf.set_font("Arial", 'B', 12)
         pdf.cell(0, 10, title, 0, 1)
         pdf.set_font("Arial", size=10)
-        pdf.multi_cell(0, 6, content.strip())
+        pdf.multi_cell(0, 6, content)
         pdf.ln(5)
 
-    pdf.output("Quantum_Safe_Tactical_Comms_Report.pdf")
+    pdf.output(filename)
     print("PDF generated successfully.")
+    return filename
 
 if __name__ == "__main__":
     create_report()
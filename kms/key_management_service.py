@@ -4,24 +4,62 @@ Key Management Service (KMS) core logic for the quantum-aware secure chat demo.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Set, Optional
 import base64
+import hmac
 import os
+import secrets
+import sys
 import threading
 import time
-import uuid
-
-from cryptography.hazmat.primitives.kdf.hkdf import HKDF
-from cryptography.hazmat.primitives import hashes
-
-from quantum_engine.bb84_simulator import run_bb84_session
+import warnings
+
+from quantum_engine.bb84_simulator import HAVE_NUMPY, run_bb84_session
+
+if os.environ.get("QSTCS_FAST_BB84") == "1":
+    if HAVE_NUMPY:
+        from quantum_engine.bb84_simulator import run_bb84_session_fast as run_bb84_session
+    else:
+        warnings.warn(
+            "QSTCS_FAST_BB84=1 but numpy is not installed; "
+            "using the pure-Python BB84 engine",
+            RuntimeWarning,
+        )
 
 LOW_QBER_THRESHOLD = 0.05
 SECURE_QBER_THRESHOLD = 0.11
 
+_HKDF_ZERO_SALT = b"\x00" * 32
+
+# HKDF-Extract always keys HMAC with the same zero salt; keep that keyed
+# state around and copy it instead of re-running the key schedule per call
+_HKDF_EXTRACT = hmac.new(_HKDF_ZERO_SALT, digestmod="sha256")
+
+# get_fresh_key() never stores its BB84 round, so it needs no unique id
+_FRESH_KEY_LABEL = "fresh-key"
+
+
+def _hkdf_sha256(ikm: bytes, info: bytes, length: int = 32) -> bytes:
+    """
+    RFC 5869 HKDF-SHA256 with no salt, limited to a single Expand block.
 
-@dataclass
+    Produces the same bytes as cryptography's HKDF(SHA256, salt=None) but
+    goes straight to hmac/OpenSSL without building an HKDF object per key.
+    """
+    if length > 32:
+        raise ValueError("single-block HKDF supports at most 32 bytes")
+    extract = _HKDF_EXTRACT.copy()
+    extract.update(ikm)
+    prk = extract.digest()
+    return hmac.new(prk, info + b"\x01", "sha256").digest()[:length]
+
+
+# dataclass(slots=True) needs 3.10; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class SessionRecord:
     session_id: str
     key: bytes
@@ -33,6 +71,11 @@ class SessionRecord:
     use_hybrid: bool
     pqc_secret: Optional[bytes]
     is_control: bool = False
+    # the key never changes, so its hex form is rendered once for joiners
+    key_hex: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.key_hex = self.key.hex()
 
 
 class KeyManagementService:
@@ -46,6 +89,7 @@ class KeyManagementService:
         self.eve_mode: bool = False
         self.attacks_detected: int = 0
         self.total_sessions: int = 0
+        self.active_sessions: int = 0
         self.total_keys_issued: int = 0
 
         self.last_qber: float = 0.0
@@ -72,9 +116,16 @@ class KeyManagementService:
         # shared demo key: the last successfully issued key so a second
         # device can retrieve the same key without a new BB84 round
         self._last_key: Optional[bytes] = None
+        self._last_key_device: Optional[str] = None
 
         self._lock = threading.Lock()
 
+        # check_link_health() hands out copies of this without taking the
+        # lock; it is rebuilt whenever one of the fields it mirrors changes
+        self._health_snapshot: Dict[str, object] = {}
+        self._health_version: int = 0
+        self._refresh_health()
+
     # ------------------------------------------------------------------
     # internal helpers
     # ------------------------------------------------------------------
@@ -88,13 +139,32 @@ class KeyManagementService:
 
     def _derive_aes_key(self, raw_key: bytes, pqc_secret: Optional[bytes]) -> bytes:
         material = raw_key + (pqc_secret or b"")
-        hkdf = HKDF(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=None,
-            info=b"bb84-demo-aes-key",
-        )
-        return hkdf.derive(material)
+        return _hkdf_sha256(material, b"bb84-demo-aes-key")
+
+    def _record_link(self, qber: float, status: str, attack_detected: bool) -> None:
+        # caller holds self._lock
+        self.last_qber = qber
+        self.last_status = status
+        self.link_status = status
+        self.last_attack_detected = attack_detected
+        if attack_detected or status == "RED":
+            self.attacks_detected += 1
+        self._refresh_health()
+
+    def _refresh_health(self) -> None:
+        # caller holds self._lock (or is __init__)
+        self._health_snapshot = {
+            "status": self.last_status,
+            "last_qber": self.last_qber,
+            "total_keys_issued": self.total_keys_issued,
+            "total_sessions": self.total_sessions,
+            "attacks_detected": self.attacks_detected,
+            "active_sessions": self.active_sessions,
+            "eve_active": self.eve_mode,
+        }
+        # bumped after the new snapshot is published, so a reader that saw
+        # version N is guaranteed a snapshot at least as new as N
+        self._health_version += 1
 
     def _next_available(self, pool: list, burned: Set) -> Optional[object]:
         for item in pool:
@@ -155,7 +225,7 @@ class KeyManagementService:
         client_b = client_b or peer or "unknown_b"
         use_hybrid = use_hybrid or pqc_enabled
 
-        session_id = uuid.uuid4().hex
+        session_id = secrets.token_hex(16)
         bb84 = run_bb84_session(session_id, num_bits=256, eve=self.eve_mode, rng_seed=None)
 
         raw_key: bytes = bb84["raw_key"]
@@ -182,17 +252,13 @@ class KeyManagementService:
         with self._lock:
             self.sessions[session_id] = record
             self.total_sessions += 1
+            self.active_sessions += 1
             self.total_keys_issued += 1
-            if attack_detected or status == "RED":
-                self.attacks_detected += 1
-
-            self.last_qber = qber
-            self.last_status = status
-            self.link_status = status
-            self.last_attack_detected = attack_detected
+            self._record_link(qber, status, attack_detected)
 
             if status != "RED":
                 self._last_key = aes_key
+                self._last_key_device = client_a
 
             self._update_escalation(status)
 
@@ -202,7 +268,7 @@ class KeyManagementService:
         return {
             "session_id": session_id,
             "key": aes_key,
-            "key_hex": aes_key.hex(),
+            "key_hex": record.key_hex,
             "status": status,
             "qber": qber,
             "attack_detected": attack_detected,
@@ -222,7 +288,7 @@ class KeyManagementService:
         return {
             "session_id": session_id,
             "key": record.key,
-            "key_hex": record.key.hex(),
+            "key_hex": record.key_hex,
             "status": record.status,
             "qber": record.qber,
             "joined": True,
@@ -263,14 +329,28 @@ class KeyManagementService:
 
         The *second* device that calls get_fresh_key without force_eve_attack
         receives the same key as the first device (shared demo-key semantics).
+        That hand-off skips BB84 entirely while Eve is not active.
         """
+        if not force_eve_attack and not self.eve_mode:
+            # read the pair under the lock so a concurrent reset() cannot
+            # leave us with the pre-reset key; never hand it out on RED
+            with self._lock:
+                cached = self._last_key
+                if (
+                    cached is not None
+                    and self._last_key_device != device_id
+                    and self.last_status != "RED"
+                ):
+                    self.total_keys_issued += 1
+                    self._refresh_health()
+                    return cached
+
         old_eve = self.eve_mode
         if force_eve_attack:
             self.eve_mode = True
 
         try:
-            session_id = uuid.uuid4().hex
-            bb84 = run_bb84_session(session_id, num_bits=256, eve=self.eve_mode, rng_seed=None)
+            bb84 = run_bb84_session(_FRESH_KEY_LABEL, num_bits=256, eve=self.eve_mode, rng_seed=None)
         finally:
             if force_eve_attack:
                 self.eve_mode = old_eve
@@ -281,12 +361,7 @@ class KeyManagementService:
         status = self._status_from_qber(qber, attack_detected)
 
         with self._lock:
-            self.last_qber = qber
-            self.last_status = status
-            self.link_status = status
-            self.last_attack_detected = attack_detected
-            if attack_detected or status == "RED":
-                self.attacks_detected += 1
+            self._record_link(qber, status, attack_detected)
 
         if attack_detected or status == "RED":
             raise Exception(
@@ -298,9 +373,11 @@ class KeyManagementService:
 
         with self._lock:
             self.total_keys_issued += 1
+            self._refresh_health()
             # store so the second device can retrieve the same key
             if self._last_key is None:
                 self._last_key = aes_key
+                self._last_key_device = device_id
             else:
                 # second caller gets the existing shared key
                 aes_key = self._last_key
@@ -315,20 +392,28 @@ class KeyManagementService:
     def eve_active(self) -> bool:
         return self.eve_mode
 
+    @property
+    def health_version(self) -> int:
+        """Changes whenever check_link_health() would return something new."""
+        return self._health_version
+
     def activate_eve(self) -> None:
         with self._lock:
             self.eve_mode = True
+            self._refresh_health()
 
     def deactivate_eve(self) -> None:
         with self._lock:
             self.eve_mode = False
+            self._refresh_health()
 
     def set_eve_mode(self, on: bool) -> None:
         with self._lock:
             self.eve_mode = on
+            self._refresh_health()
 
     def trigger_attack(self) -> Dict[str, object]:
-        session_id = f"attack-{uuid.uuid4().hex[:8]}"
+        session_id = f"attack-{secrets.token_hex(4)}"
         bb84 = run_bb84_session(session_id, num_bits=256, eve=True, rng_seed=None)
 
         qber: float = float(bb84["qber"])
@@ -353,11 +438,7 @@ class KeyManagementService:
 
         with self._lock:
             self.sessions[session_id] = record
-            self.attacks_detected += 1
-            self.last_qber = qber
-            self.last_status = "RED"
-            self.link_status = "RED"
-            self.last_attack_detected = True
+            self._record_link(qber, "RED", True)
             self._update_escalation("RED")
 
         return {
@@ -373,20 +454,13 @@ class KeyManagementService:
     # ------------------------------------------------------------------
 
     def check_link_health(self) -> Dict[str, object]:
-        with self._lock:
-            return {
-                "status": self.last_status,
-                "last_qber": self.last_qber,
-                "total_keys_issued": self.total_keys_issued,
-                "total_sessions": self.total_sessions,
-                "attacks_detected": self.attacks_detected,
-                "active_sessions": sum(1 for s in self.sessions.values() if not s.is_control),
-                "eve_active": self.eve_mode,
-            }
+        # no lock: the snapshot is replaced, never mutated, once published,
+        # so reading the reference and copying it is safe on its own
+        return self._health_snapshot.copy()
 
     def get_link_status(self) -> Dict[str, object]:
         with self._lock:
-            active_sessions = sum(1 for s in self.sessions.values() if not s.is_control)
+            active_sessions = self.active_sessions
             label = {
                 1: "SAFE",
                 2: "TACTICAL RETREAT",
@@ -430,6 +504,7 @@ class KeyManagementService:
             self.eve_mode = False
             self.attacks_detected = 0
             self.total_sessions = 0
+            self.active_sessions = 0
             self.total_keys_issued = 0
             self.last_qber = 0.0
             self.last_status = "GREEN"
@@ -443,6 +518,8 @@ class KeyManagementService:
             self.current_ip = self.ip_pool[0]
             self.current_network = self.network_pool[0]
             self._last_key = None
+            self._last_key_device = None
+            self._refresh_health()
 
     def reset_for_demo(self) -> None:
         self.reset()
@@ -11,6 +11,7 @@ ENDPOINTS:
   POST /create_session    — Create a paired key exchange session (runs BB84)
   POST /join_session      — Join an existing session and get the shared key
   GET  /link_status       — Query quantum link health (GREEN/YELLOW/RED)
+  GET  /link_status/wait  — Long-poll until link health changes (ETag/since)
   GET  /sessions          — List active sessions (no key material)
   POST /activate_eve      — Turn on eavesdropper (quantum channel attack)
   POST /deactivate_eve    — Turn off eavesdropper
@@ -26,13 +27,21 @@ Classification: UNCLASSIFIED
 
 import sys
 import os
+import asyncio
+import functools
 import socket
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # stdlib json via JSONResponse
+    orjson = None
+
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from kms.key_management_service import KeyManagementService
@@ -63,10 +72,21 @@ class LegacyKeyRequest(BaseModel):
 # APPLICATION
 # =============================================================================
 
+class _ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+# compact JSON either way; router_guard.sh greps for "status":"..."
+_JSONResponseClass = _ORJSONResponse if orjson is not None else JSONResponse
+
 app = FastAPI(
     title="QSTCS Key Management Service",
     description="Session-based quantum key distribution API",
     version="3.1.0",
+    default_response_class=_JSONResponseClass,
 )
 
 app.add_middleware(
@@ -80,6 +100,8 @@ app.add_middleware(
 kms = KeyManagementService()
 
 
+# the LAN address does not change while the server runs
+@functools.lru_cache(maxsize=1)
 def get_lan_ip() -> str:
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -91,11 +113,39 @@ def get_lan_ip() -> str:
         return "127.0.0.1"
 
 
+# =============================================================================
+# LINK-CHANGE NOTIFICATION
+# =============================================================================
+
+# Set (and dropped) whenever an endpoint that can change link health
+# finishes; /link_status/wait parks on it. Every KMS call happens on the
+# event loop, so no locking is needed around it.
+_link_changed: Optional[asyncio.Event] = None
+
+
+def _wake_link_waiters() -> None:
+    global _link_changed
+    if _link_changed is not None:
+        _link_changed.set()
+        _link_changed = None
+
+
+def _wakes_link_waiters(endpoint):
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            _wake_link_waiters()
+    return wrapper
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
 
 @app.post("/create_session")
+@_wakes_link_waiters
 async def create_session(req: CreateSessionRequest):
     """
     Create a key exchange session between two devices.
@@ -151,6 +201,7 @@ async def join_session(req: JoinSessionRequest):
 
 
 @app.post("/get_session_key")
+@_wakes_link_waiters
 async def get_session_key(req: LegacyKeyRequest):
     """
     Simplified key request (backward compatible).
@@ -187,19 +238,71 @@ async def get_session_key(req: LegacyKeyRequest):
         }
 
 
+# (health_version, rendered body) of the last /link_status response; the
+# router polls far more often than the link state changes
+_link_status_cache = (None, b"")
+
+
+def _link_status_response() -> Response:
+    global _link_status_cache
+    version = kms.health_version
+    cached_version, body = _link_status_cache
+    if cached_version != version:
+        health = kms.check_link_health()
+        body = _JSONResponseClass({
+            "status": health["status"],
+            "qber": health["last_qber"],
+            "total_keys_issued": health["total_keys_issued"],
+            "total_sessions": health["total_sessions"],
+            "attacks_detected": health["attacks_detected"],
+            "active_sessions": health["active_sessions"],
+            "eve_active": health["eve_active"],
+        }).body
+        _link_status_cache = (version, body)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": f'"{version}"'},
+    )
+
+
 @app.get("/link_status")
 async def link_status():
     """Current quantum link health. Polled by the router gatekeeper."""
-    health = kms.check_link_health()
-    return {
-        "status": health["status"],
-        "qber": health["last_qber"],
-        "total_keys_issued": health["total_keys_issued"],
-        "total_sessions": health["total_sessions"],
-        "attacks_detected": health["attacks_detected"],
-        "active_sessions": health["active_sessions"],
-        "eve_active": health["eve_active"],
-    }
+    return _link_status_response()
+
+
+@app.get("/link_status/wait")
+async def link_status_wait(
+    since: Optional[str] = None,
+    timeout: float = Query(25.0, ge=0.0, le=60.0),
+):
+    """
+    Long-poll variant of /link_status.
+
+    Pass the ETag of the last response as ?since= (quoted as sent or
+    bare); the request is held until link health changes or the timeout
+    (seconds) elapses, then the current status is returned either way.
+    """
+    if since is not None:
+        try:
+            since = int(since.strip('"'))
+        except ValueError:
+            raise HTTPException(status_code=422, detail="since must be a /link_status ETag")
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    global _link_changed
+    while since == kms.health_version:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        if _link_changed is None:
+            _link_changed = asyncio.Event()
+        try:
+            await asyncio.wait_for(_link_changed.wait(), remaining)
+        except asyncio.TimeoutError:
+            break
+    return _link_status_response()
 
 
 @app.get("/sessions")
@@ -209,6 +312,7 @@ async def list_sessions():
 
 
 @app.post("/activate_eve")
+@_wakes_link_waiters
 async def activate_eve():
     """Turn on the eavesdropper. All future BB84 exchanges will detect Eve."""
     kms.activate_eve()
@@ -216,6 +320,7 @@ async def activate_eve():
 
 
 @app.post("/deactivate_eve")
+@_wakes_link_waiters
 async def deactivate_eve():
     """Turn off the eavesdropper."""
     kms.deactivate_eve()
@@ -223,6 +328,7 @@ async def deactivate_eve():
 
 
 @app.post("/trigger_attack")
+@_wakes_link_waiters
 async def trigger_attack():
     """
     Run a single BB84 probe with Eve active.
@@ -238,6 +344,7 @@ async def trigger_attack():
 
 
 @app.post("/reset")
+@_wakes_link_waiters
 async def reset_system():
     """Clear all sessions, metrics, and Eve state."""
     kms.reset()
@@ -6,13 +6,40 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import List, Dict, Tuple
+import importlib.util
+import os
 import random
 
+# numpy is optional (run_bb84_session_fast, simulate_bb84) and is only
+# imported on first use, so the pure-Python path never pays its import
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
 QBER_THRESHOLD = 0.11
 QBER_SECURITY_THRESHOLD = 0.11   # alias used by tests and dashboard
 DEFAULT_NOISE_RATE = 0.01
 
 
+# unseeded fast rounds share one generator, created on first use; building
+# a fresh one costs about a third of a 256-bit round. Forked children
+# reseed so they never replay the parent's stream.
+_RNG = None
+
+
+def _reseed_rng() -> None:
+    global _RNG
+    import numpy as np
+    _RNG = np.random.default_rng()
+
+
+def _reseed_after_fork() -> None:
+    if _RNG is not None:
+        _reseed_rng()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
+
+
 def _bits_to_bytes(bits: List[int]) -> bytes:
     if not bits:
         return b""
@@ -123,6 +150,60 @@ def run_bb84_session(
     }
 
 
+def run_bb84_session_fast(
+    session_id: str,
+    num_bits: int = 256,
+    eve: bool = False,
+    rng_seed: int | None = None,
+    eve_intercept_rate: float = 1.0,
+) -> Dict[str, object]:
+    """
+    NumPy-vectorised run_bb84_session with the same channel model and
+    return shape. Draws come from numpy's PCG64 generator, so a given
+    rng_seed does not reproduce the pure-Python key.
+    """
+    if not HAVE_NUMPY:
+        raise RuntimeError("run_bb84_session_fast requires numpy")
+    import numpy as np
+
+    if rng_seed is not None:
+        rng = np.random.default_rng(rng_seed)
+    else:
+        if _RNG is None:
+            _reseed_rng()
+        rng = _RNG
+    alice_bits, alice_bases, bob_bases, coin = rng.integers(
+        0, 2, size=(4, num_bits), dtype=np.uint8
+    )
+
+    if eve:
+        intercepted = rng.random(num_bits) < eve_intercept_rate
+        eve_bases, eve_coin = rng.integers(0, 2, size=(2, num_bits), dtype=np.uint8)
+        eve_bits = np.where(eve_bases == alice_bases, alice_bits, eve_coin)
+        sent_bits = np.where(intercepted, eve_bits, alice_bits)
+        sent_bases = np.where(intercepted, eve_bases, alice_bases)
+        noise = (rng.random(num_bits) < DEFAULT_NOISE_RATE) & ~intercepted
+    else:
+        sent_bits, sent_bases = alice_bits, alice_bases
+        noise = rng.random(num_bits) < DEFAULT_NOISE_RATE
+
+    # right basis: the sent bit, flipped by channel noise; wrong basis: a coin
+    bob_bits = np.where(bob_bases == sent_bases, sent_bits ^ noise, coin)
+
+    sift = alice_bases == bob_bases
+    sifted_bob = bob_bits[sift]
+    total = sifted_bob.size
+    errors = int(np.count_nonzero(alice_bits[sift] != sifted_bob))
+    qber = (errors / total) if total else 1.0
+
+    return {
+        "session_id": session_id,
+        "raw_key": np.packbits(sifted_bob).tobytes(),
+        "qber": qber,
+        "attack_detected": qber >= QBER_THRESHOLD,
+    }
+
+
 def simulate_bb84(
     num_bits: int = 512,
     eve_present: bool = False,
@@ -132,11 +213,14 @@ def simulate_bb84(
     Compatibility alias used by tests and dashboard.
     Returns (key_bytes_32, qber, attack_detected).
     Always returns exactly 32 bytes by padding or truncating via HKDF.
+    Runs on the NumPy engine when numpy is installed; callers cannot seed
+    it, so nothing depends on the pure-Python draw sequence.
     """
     from cryptography.hazmat.primitives.kdf.hkdf import HKDF
     from cryptography.hazmat.primitives import hashes
 
-    result = run_bb84_session(
+    engine = run_bb84_session_fast if HAVE_NUMPY else run_bb84_session
+    result = engine(
         session_id="sim",
         num_bits=num_bits,
         eve=eve_present,
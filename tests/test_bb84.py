@@ -1,5 +1,7 @@
 import unittest
-from quantum_engine.bb84_simulator import simulate_bb84, QBER_SECURITY_THRESHOLD
+from quantum_engine.bb84_simulator import (
+    simulate_bb84, run_bb84_session_fast, QBER_SECURITY_THRESHOLD, HAVE_NUMPY,
+)
 
 
 class TestBB84Simulator(unittest.TestCase):
@@ -19,5 +21,19 @@ class TestBB84Simulator(unittest.TestCase):
         self.assertEqual(QBER_SECURITY_THRESHOLD, 0.11)
 
 
+@unittest.skipUnless(HAVE_NUMPY, "numpy not installed")
+class TestBB84Fast(unittest.TestCase):
+    def test_no_eve(self):
+        result = run_bb84_session_fast("t", num_bits=512, eve=False)
+        self.assertLess(result["qber"], 0.05)
+        self.assertFalse(result["attack_detected"])
+        self.assertGreater(len(result["raw_key"]), 16)
+
+    def test_with_eve(self):
+        result = run_bb84_session_fast("t", num_bits=512, eve=True, eve_intercept_rate=1.0)
+        self.assertGreater(result["qber"], 0.15)
+        self.assertTrue(result["attack_detected"])
+
+
 if __name__ == "__main__":
     unittest.main()
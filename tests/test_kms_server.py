@@ -0,0 +1,119 @@
+"""
+Tests for the KMS HTTP layer (kms_server.py), driven in-process through
+httpx's ASGI transport; no uvicorn or sockets involved.
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kms_server
+
+
+class TestLinkStatus(unittest.IsolatedAsyncioTestCase):
+    """Tests for the cached /link_status response."""
+
+    async def asyncSetUp(self):
+        kms_server.kms.reset()
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=kms_server.app),
+            base_url="http://kms",
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_unchanged_link_reuses_body(self):
+        """Test repeated polls without a mutation return the same ETag and body."""
+        first = await self.client.get("/link_status")
+        cached = kms_server._link_status_cache
+        second = await self.client.get("/link_status")
+
+        self.assertIs(kms_server._link_status_cache, cached)
+        self.assertEqual(first.headers["etag"], second.headers["etag"])
+        self.assertEqual(first.content, second.content)
+
+    async def test_body_is_compact_json(self):
+        """Test the body keeps the compact form router_guard.sh greps for."""
+        resp = await self.client.get("/link_status")
+
+        self.assertIn(b'"status":"GREEN"', resp.content)
+        self.assertIn(b'"qber":', resp.content)
+
+    async def test_mutation_changes_body(self):
+        """Test a link change produces a new ETag and body."""
+        before = await self.client.get("/link_status")
+        await self.client.post("/activate_eve")
+        after = await self.client.get("/link_status")
+
+        self.assertNotEqual(before.headers["etag"], after.headers["etag"])
+        self.assertNotEqual(before.content, after.content)
+        self.assertTrue(after.json()["eve_active"])
+
+
+class TestLinkStatusWait(unittest.IsolatedAsyncioTestCase):
+    """Tests for the /link_status/wait long-poll endpoint."""
+
+    async def asyncSetUp(self):
+        kms_server.kms.reset()
+        # each test runs on its own event loop
+        kms_server._link_changed = None
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=kms_server.app),
+            base_url="http://kms",
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_returns_immediately_when_since_is_stale(self):
+        """Test a mismatched since returns the current status at once."""
+        etag = (await self.client.get("/link_status")).headers["etag"]
+        await self.client.post("/activate_eve")
+
+        resp = await asyncio.wait_for(
+            self.client.get("/link_status/wait", params={"since": etag, "timeout": 30}),
+            timeout=5,
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp.headers["etag"], etag)
+        self.assertTrue(resp.json()["eve_active"])
+
+    async def test_wakes_on_activate_eve(self):
+        """Test a parked waiter returns as soon as Eve is switched on."""
+        etag = (await self.client.get("/link_status")).headers["etag"]
+        waiter = asyncio.create_task(
+            self.client.get("/link_status/wait", params={"since": etag, "timeout": 30})
+        )
+        await asyncio.sleep(0.05)
+        self.assertFalse(waiter.done())
+
+        await self.client.post("/activate_eve")
+        resp = await asyncio.wait_for(waiter, timeout=5)
+        self.assertNotEqual(resp.headers["etag"], etag)
+        self.assertTrue(resp.json()["eve_active"])
+
+    async def test_returns_on_timeout(self):
+        """Test an unchanged link is reported once the timeout elapses."""
+        etag = (await self.client.get("/link_status")).headers["etag"]
+
+        resp = await self.client.get(
+            "/link_status/wait", params={"since": etag.strip('"'), "timeout": 0.1}
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.headers["etag"], etag)
+        self.assertFalse(resp.json()["eve_active"])
+
+    async def test_rejects_malformed_since(self):
+        """Test a since value that is not an ETag is a client error."""
+        resp = await self.client.get("/link_status/wait", params={"since": "abc"})
+        self.assertEqual(resp.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
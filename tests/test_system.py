@@ -133,6 +133,47 @@ class TestKeyManagementService(unittest.TestCase):
         health = self.kms.check_link_health()
         self.assertEqual(health['attacks_detected'], 1)
     
+    def test_key_derivation_matches_hkdf(self):
+        """Test the inlined HKDF matches the cryptography implementation."""
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+        from cryptography.hazmat.primitives import hashes
+        from kms.key_management_service import _hkdf_sha256
+
+        raw = os.urandom(48)
+        expected = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"bb84-demo-aes-key",
+        ).derive(raw)
+        self.assertEqual(_hkdf_sha256(raw, b"bb84-demo-aes-key"), expected)
+    
+    def test_active_sessions_excludes_control(self):
+        """Test attack probes are not counted as active sessions."""
+        self.kms.create_session("Alpha", "Bravo")
+        self.kms.create_session("Charlie", "Delta")
+        self.kms.trigger_attack()
+        
+        self.assertEqual(self.kms.check_link_health()['active_sessions'], 2)
+        self.assertEqual(self.kms.get_link_status()['active_sessions'], 2)
+
+    def test_health_snapshot_tracks_changes(self):
+        """Test check_link_health reflects Eve toggles and is a private copy."""
+        health = self.kms.check_link_health()
+        health['eve_active'] = True
+        self.assertFalse(self.kms.check_link_health()['eve_active'])
+
+        self.kms.activate_eve()
+        self.assertTrue(self.kms.check_link_health()['eve_active'])
+        self.kms.reset()
+        self.assertFalse(self.kms.check_link_health()['eve_active'])
+
+    def test_health_version_changes_on_update(self):
+        """Test health_version moves whenever the link health changes."""
+        version = self.kms.health_version
+        self.kms.create_session("Alpha", "Bravo")
+        self.assertNotEqual(self.kms.health_version, version)
+
     def test_key_sharing_demo_mode(self):
         """Test that second device gets same key for demo."""
         key1 = self.kms.get_fresh_key("DeviceA")
@@ -140,7 +181,16 @@ class TestKeyManagementService(unittest.TestCase):
         
         # Keys should match for demo mode
         self.assertEqual(key1, key2)
-    
+
+    def test_shared_key_not_reused_after_attack(self):
+        """Test a RED link forces a fresh BB84 round before the shared key."""
+        self.kms.get_fresh_key("DeviceA")
+        self.kms.trigger_attack()
+        self.assertEqual(self.kms.check_link_health()['status'], "RED")
+
+        self.kms.get_fresh_key("DeviceB")
+        self.assertNotEqual(self.kms.check_link_health()['status'], "RED")
+
     def test_reset_functionality(self):
         """Test that reset clears all state."""
         self.kms.get_fresh_key("Device1")
@@ -252,7 +302,7 @@ class TestEndToEndFlow(unittest.TestCase):
 
 
 def run_tests():
-    """Run all tests with verbose output."""
+    """Run all tests, printing only the summary and any failures."""
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
     
@@ -262,8 +312,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestSoldierDevice))
     suite.addTests(loader.loadTestsFromTestCase(TestEndToEndFlow))
     
-    # Run with verbosity
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Dots plus summary; use `python -m pytest tests/ -v` for per-test names
+    runner = unittest.TextTestRunner(verbosity=1)
     result = runner.run(suite)
     
     return result.wasSuccessful()